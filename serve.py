@@ -2,58 +2,504 @@
 """
 Simple HTTPS server with CORS and pagination API for serving DXX Dashboard.
 """
+import gc
+import gzip
+import http.client
 import http.server
 import socketserver
 import signal
+import socket
 import sys
 import json
 import os
+import re
+import select
 import ssl
-import urllib.request
+import threading
+import time
+import traceback
 from urllib.parse import urlparse, parse_qs, quote
 
+# orjson returns bytes directly and is several times faster than the stdlib
+# encoder; fall back to json when it isn't installed
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
+# simdjson is faster still for the one-shot games.json parse at startup
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# watchfiles (inotify) tells us when games.json changes; otherwise we poll
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
 PORT = 8443
 TRACKER_API = 'https://127.0.0.1:9998'
 DIRECTORY = "public"
 GAMES_FILE = os.path.join(DIRECTORY, "data", "games.json")
 CERT_FILE = "server.crt"
 KEY_FILE = "server.key"
+# Server processes, each with its own GIL and its own listening socket on
+# PORT; the kernel spreads new connections across them (SO_REUSEPORT)
+WORKERS = os.cpu_count() or 1
+
+# Timestamp embedded in old filename-based game ids (MM-DD-YYYY-HH-MM-SS)
+_TS_RE = re.compile(r'(\d{2}-\d{2}-\d{4}-\d{2}-\d{2}-\d{2})')
 
-# Cache the games data in memory
-_games_cache = None
+# Only the encoded caches below are kept in memory; the parsed games.json
+# is dropped once they're built, as a Python object tree it's several
+# times the file size
+_games_loaded = False
 _games_cache_mtime = None
 
+# Requests are served from worker threads. The caches below are read
+# lock-free; loads and reloads build replacements under this lock and then
+# swap them in, and inserts into the response cache take it too.
+_cache_lock = threading.Lock()
+
+# Changes to games.json are picked up outside the request path, so
+# requests never stat the file: by a watcher thread, or by the worker
+# supervisor. Either polls this often (seconds) if it isn't using watchfiles.
+GAMES_POLL_INTERVAL = 5
+_watcher = None
+_watch_stop = threading.Event()
+_games_failed_mtime = None
+
+# Derived from the games cache, rebuilt whenever it is reloaded
+_games_meta = None
+_games_by_id = {}
+_games_by_ts = None
+_game_json = []
+_dated_games = []
+_players_json = b'[]'
+
+# Encoded API response bodies as (body, gzipped body) pairs. A body is
+# compressed when a client that accepts gzip first asks for it (the pair
+# holds None until then). Rebuilt on reload.
+GZIP_LEVEL = 6
+RESPONSE_CACHE_SIZE = 64
+_response_cache = {}
+_meta_cache = None
+
+# The games of every page for the page sizes the dashboard asks for are
+# joined up front; the players and pagination are added per response, so
+# each limit costs about one more copy of the encoded games
+PAGE_CACHE_LIMITS = (50, 100, 200, 500)
+_page_cache = {}
+
+def parse_games_json(buf):
+    """Parse the raw games.json bytes
+
+    With simdjson the document is left lazy: building the caches only reads
+    a few fields per game and takes each game's JSON as-is (see
+    encode_json()), so the games are never materialized as Python objects.
+    """
+    if simdjson is not None:
+        return simdjson.Parser().parse(buf)
+    return json_loads(buf)
+
+def encode_json(value):
+    """Encode a parsed value, reusing a lazy simdjson element's own JSON"""
+    mini = getattr(value, 'mini', None)
+    return mini if mini is not None else json_dumps(value)
+
 def load_games_data():
-    """Load games.json and cache it in memory"""
-    global _games_cache, _games_cache_mtime
+    """Make sure games.json has been loaded into the in-memory caches"""
+    # Return if already loaded (don't even check mtime on every request)
+    if _games_loaded:
+        return
+    
+    with _cache_lock:
+        # Another request thread may have loaded it while we waited
+        if not _games_loaded:
+            _load_games_file()
+
+def reload_games_data():
+    """Rebuild the caches from games.json, keeping the old ones if that fails"""
+    with _cache_lock:
+        _load_games_file()
+
+def _load_games_file():
+    """Build every cache from games.json and swap them in (holding _cache_lock)"""
+    global _games_loaded, _games_cache_mtime, _games_meta, _meta_cache
+    global _games_by_id, _games_by_ts, _game_json, _dated_games
+    global _players_json, _page_cache, _response_cache
     
     try:
-        # Return cache if already loaded (don't even check mtime on every request)
-        if _games_cache is not None:
-            return _games_cache
-        
-        # Load fresh data only on first call
         print(f"Loading games data from {GAMES_FILE}...")
-        import time
         start = time.time()
-        with open(GAMES_FILE, 'r') as f:
-            _games_cache = json.load(f)
-        _games_cache_mtime = os.path.getmtime(GAMES_FILE)
-        elapsed = time.time() - start
-        print(f"Loaded {len(_games_cache.get('games', []))} games into memory cache ({elapsed:.2f}s)")
-        return _games_cache
+        with open(GAMES_FILE, 'rb') as f:
+            mtime = os.fstat(f.fileno()).st_mtime
+            buf = f.read()
+        data = parse_games_json(buf)
+        del buf
+        meta, game_json, by_id, dated_games = scan_games(data)
+        players_json = encode_json(data.get('players', []))
+        # Everything else is built from the encoded bytes
+        del data
+        meta_json = json_dumps(meta)
+        meta_cache = (meta_json, gzip.compress(meta_json, GZIP_LEVEL))
+        page_cache = build_page_cache(game_json)
     except Exception as e:
         print(f"Error loading games data: {e}")
         raise
+    
+    # Swap the new caches in. The response cache goes last, so entries a
+    # request thread builds from the old caches land in the discarded dict.
+    _games_cache_mtime = mtime
+    _games_meta = meta
+    _game_json = game_json
+    _games_by_id = by_id
+    _dated_games = dated_games
+    _games_by_ts = None
+    _players_json = players_json
+    _meta_cache = meta_cache
+    _page_cache = page_cache
+    _response_cache = {}
+    # Publish last: other threads treat this as the caches being ready
+    _games_loaded = True
+    elapsed = time.time() - start
+    print(f"Loaded {len(game_json)} games into memory cache ({elapsed:.2f}s)")
+
+def watch_games_file():
+    """Reload the caches whenever games.json changes, until _watch_stop is set"""
+    if watchfiles is not None:
+        # Watch the directory, so the file being replaced is seen too
+        name = os.path.basename(GAMES_FILE)
+        changes = watchfiles.watch(os.path.dirname(GAMES_FILE), recursive=False,
+                                   watch_filter=lambda change, path: os.path.basename(path) == name,
+                                   stop_event=_watch_stop)
+    else:
+        changes = iter(lambda: _watch_stop.wait(GAMES_POLL_INTERVAL), True)
+    
+    for _ in changes:
+        reload_if_changed()
+
+def reload_if_changed():
+    """Reload the caches if games.json has changed; returns whether it did"""
+    global _games_failed_mtime
+    mtime = None
+    try:
+        mtime = os.path.getmtime(GAMES_FILE)
+        if mtime == _games_cache_mtime or mtime == _games_failed_mtime:
+            return False
+        reload_games_data()
+        return True
+    except Exception:
+        # Probably caught mid-write; keep serving the old caches and
+        # retry once the file changes again
+        _games_failed_mtime = mtime
+        return False
+
+def start_games_watcher():
+    """Start watch_games_file() in a background thread"""
+    global _watcher
+    _watcher = threading.Thread(target=watch_games_file, daemon=True)
+    _watcher.start()
+
+def stop_games_watcher():
+    """Stop the watcher thread and wait for it, ahead of interpreter exit"""
+    # watchfiles blocks in native code, which aborts the process if the
+    # interpreter tears the thread down at exit rather than letting it return
+    _watch_stop.set()
+    if _watcher is not None:
+        _watcher.join()
+
+def scan_games(data):
+    """Encode each game and compute the metadata and id lookup table in one pass
+
+    The id table maps to the game's encoded JSON, so single-game responses
+    never re-encode it either. (timestamp, encoded game) pairs are collected
+    for the legacy timestamp index, which is built later without the parsed
+    games. Player counts are only collected in the loop; duels and FFA
+    games are tallied from that list afterwards with list.count(), in C.
+    """
+    games = data.get('games', [])
+    players = data.get('players', [])
+    
+    player_counts = []
+    count_players = player_counts.append
+    game_json = []
+    dated_games = []
+    by_id = {}
+    setdefault = by_id.setdefault
+    for g in games:
+        get = g.get
+        encoded = encode_json(g)
+        game_json.append(encoded)
+        timestamp = get('timestamp')
+        if timestamp:
+            dated_games.append((timestamp, encoded))
+        
+        count_players(len(get('players') or ()))
+        
+        # First match wins, same as the linear scan this replaces
+        game_id = get('id')
+        if game_id:
+            setdefault(game_id, encoded)
+    
+    # Calculate stats: 2 players is a duel, anything more is FFA
+    duels = player_counts.count(2)
+    ffa = len(player_counts) - player_counts.count(0) - player_counts.count(1) - duels
+    
+    meta = {
+        'totalGames': len(games),
+        'totalPlayers': len(players),
+        'duels': duels,
+        'ffa': ffa,
+        'oldestGame': games[-1]['timestamp'] if games else None,
+        'newestGame': games[0]['timestamp'] if games else None
+    }
+    return meta, game_json, by_id, dated_games
+
+def index_games_by_ts(dated_games):
+    """Build the lookup table (to encoded games) for old filename-based game ids"""
+    by_ts = {}
+    for timestamp, encoded in dated_games:
+        # Those ids embed the 14 timestamp digits; for ISO timestamps
+        # they are the leading digits once the separators are gone
+        game_ts = timestamp.replace(':', '').replace('T', '-').replace('Z', '')
+        by_ts.setdefault(game_ts.replace('-', '')[:14], encoded)
+    return by_ts
+
+def get_games_by_ts():
+    """Return the legacy timestamp index, building it on first use"""
+    global _games_by_ts
+    # Only old links hit this, so it isn't worth a pass over every game at
+    # load time; racing threads at worst build identical tables
+    by_ts = _games_by_ts
+    if by_ts is None:
+        dated_games = _dated_games
+        by_ts = index_games_by_ts(dated_games)
+        # Don't publish a table for games a reload has since replaced
+        if dated_games is _dated_games:
+            _games_by_ts = by_ts
+    return by_ts
+
+# Everything after a page's games; every page has this one shape, so the
+# envelope is filled in directly instead of encoding a pagination dict
+PAGE_RESPONSE_TAIL = (b'],"players":%s,"pagination":{"page":%d,"limit":%d,'
+                      b'"total":%d,"totalPages":%d,"hasMore":%s}}')
+
+def build_games_response(game_json, players_json, page, limit, load_all, games_fragment=None):
+    """Encode one page (or all) of games as a JSON response body
+
+    games_fragment is the page's games already joined, if it's at hand.
+    """
+    total = len(game_json)
+    
+    # If load_all is requested, return everything
+    if load_all:
+        games_fragment = b','.join(game_json)
+        page, limit, total_pages, has_more = 1, total, 1, False
+    else:
+        # Calculate pagination
+        start = (page - 1) * limit
+        end = start + limit
+        
+        if games_fragment is None:
+            games_fragment = b','.join(game_json[start:end])
+        total_pages = (total + limit - 1) // limit
+        has_more = end < total
+    
+    # Join the pre-encoded games and players rather than re-encoding them
+    return (b'{"games":[' + games_fragment +
+            PAGE_RESPONSE_TAIL % (players_json, page, limit, total, total_pages,
+                                  b'true' if has_more else b'false'))
+
+def build_page_cache(game_json):
+    """Join the games of every page for each of PAGE_CACHE_LIMITS, keyed by (limit, page)"""
+    page_cache = {}
+    for limit in PAGE_CACHE_LIMITS:
+        for page, start in enumerate(range(0, len(game_json), limit), 1):
+            page_cache[(limit, page)] = b','.join(game_json[start:start + limit])
+    return page_cache
+
+def accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header value allows a gzip response"""
+    qvalues = {}
+    for coding in accept_encoding.lower().split(','):
+        name, *params = coding.split(';')
+        qvalue = 1.0
+        for param in params:
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[name.strip()] = qvalue
+    # q=0 means "not acceptable"; * covers codings not listed by name
+    return qvalues.get('gzip', qvalues.get('*', 0.0)) > 0
+
+def _cache_response(response_cache, key, bodies):
+    """Insert (or update) a response cache entry, evicting the oldest if it's full"""
+    with _cache_lock:
+        if key not in response_cache and len(response_cache) >= RESPONSE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del response_cache[next(iter(response_cache))]
+        response_cache[key] = bodies
+
+def get_games_response(page, limit, load_all, gzipped=False):
+    """Return the encoded /api/games body, gzipped if asked, from the caches where possible"""
+    # Recently requested pages share one encoded body until the next reload.
+    # Take the cache before the data it's built from (see _load_games_file()).
+    response_cache = _response_cache
+    key = ('all',) if load_all else (page, limit)
+    bodies = response_cache.get(key)
+    if bodies is None:
+        # Standard page sizes had their games joined at load time
+        games_fragment = None if load_all else _page_cache.get((limit, page))
+        body = build_games_response(_game_json, _players_json, page, limit, load_all,
+                                    games_fragment)
+        bodies = (body, None)
+        _cache_response(response_cache, key, bodies)
+    
+    if not gzipped:
+        return bodies[0]
+    if bodies[1] is None:
+        # Racing threads at worst compress the same body twice
+        bodies = (bodies[0], gzip.compress(bodies[0], GZIP_LEVEL))
+        _cache_response(response_cache, key, bodies)
+    return bodies[1]
+
+def get_games_meta_response(gzipped=False):
+    """Return the encoded /api/games/meta body, gzipped if asked"""
+    return _meta_cache[1] if gzipped else _meta_cache[0]
+
+def get_single_game_response(game_id):
+    """Return the encoded /api/games/<id> body, or None if there's no such game"""
+    # Try to find game by ID
+    game = _games_by_id.get(game_id)
+    
+    # If not found by ID, try matching by old filename-based ID
+    if game is None and '-' in game_id:
+        ts_match = _TS_RE.search(game_id)
+        if ts_match:
+            game = get_games_by_ts().get(ts_match.group(1).replace('-', ''))
+    
+    if game is None:
+        return None
+    return b'{"game":' + game + b',"players":' + _players_json + b'}'
+
+# Skip SSL verification for self-signed cert (local loopback)
+_tracker_ssl_context = ssl.create_default_context()
+_tracker_ssl_context.check_hostname = False
+_tracker_ssl_context.verify_mode = ssl.CERT_NONE
+
+# Idle keep-alive connections to the tracker, shared by all request threads
+# so proxied requests skip the TCP connect and TLS handshake
+TRACKER_POOL_SIZE = 2
+_tracker_pool = []
+_tracker_pool_lock = threading.Lock()
+
+# What a pooled connection the tracker closed while it sat idle fails with.
+# Anything else (a timeout in particular) may have reached the tracker, so
+# the request isn't sent again.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError,
+                            BrokenPipeError)
 
-class ReusableTCPServer(socketserver.TCPServer):
+def tracker_get(path):
+    """GET path from the tracker API over a pooled connection, returning the body"""
+    while True:
+        with _tracker_pool_lock:
+            conn = _tracker_pool.pop() if _tracker_pool else None
+        reused = conn is not None
+        if conn is None:
+            tracker = urlparse(TRACKER_API)
+            conn = http.client.HTTPSConnection(tracker.hostname, tracker.port, timeout=5,
+                                               context=_tracker_ssl_context)
+        
+        try:
+            conn.request('GET', path)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            # Try the next pooled connection, or a fresh one
+            if not reused:
+                raise
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            raise
+    
+    if resp.will_close:
+        conn.close()
+    else:
+        with _tracker_pool_lock:
+            if len(_tracker_pool) < TRACKER_POOL_SIZE:
+                _tracker_pool.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+    
+    if resp.status >= 400:
+        raise http.client.HTTPException(f"HTTP Error {resp.status}: {resp.reason}")
+    return body
+
+class ReusableTCPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
     allow_reuse_address = True
     allow_reuse_port = True
+    # One thread per connection, so a slow client or a tracker proxy
+    # request waiting on its timeout no longer stalls everyone else. They
+    # aren't daemon threads, so a stopping worker can let them finish.
+    daemon_threads = False
+    
+    def handle_error(self, request, client_address):
+        # Failed TLS handshakes and dropped connections are routine
+        if isinstance(sys.exc_info()[1], OSError):
+            return
+        super().handle_error(request, client_address)
 
 class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Socket timeout for the TLS handshake and each request read
+    timeout = 30
+    # TCP_NODELAY on each connection: responses are written whole, so
+    # Nagle's algorithm would only delay the tail of a small JSON body
+    disable_nagle_algorithm = True
+    
+    # Spelled out (it's BaseHTTPRequestHandler's default) so the response
+    # head below is built from it
+    protocol_version = 'HTTP/1.0'
+    
+    # What send_response() + end_headers() would send ahead of a JSON body,
+    # with slots for the encoding headers and the Content-Length
+    JSON_RESPONSE_HEAD = protocol_version.encode('latin-1') + (
+        b' 200 OK\r\n'
+        b'Content-Type: application/json\r\n'
+        b'Access-Control-Allow-Origin: *\r\n'
+        b'Access-Control-Allow-Methods: GET, OPTIONS\r\n'
+        b'Access-Control-Allow-Headers: Content-Type\r\n'
+        b'Cache-Control: no-cache\r\n'
+        b'%sContent-Length: %d\r\n'
+        b'\r\n'
+    )
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=DIRECTORY, **kwargs)
     
+    def setup(self):
+        super().setup()
+        # The TLS handshake is deferred from accept() to the request thread,
+        # so a client that stalls mid-handshake can't block the accept loop
+        if isinstance(self.connection, ssl.SSLSocket):
+            self.connection.do_handshake()
+    
     def end_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
@@ -65,6 +511,24 @@ class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_response(200)
         self.end_headers()
     
+    def accepts_gzip(self):
+        return accepts_gzip(self.headers.get('Accept-Encoding', ''))
+    
+    def send_json(self, body, gzipped=None):
+        """Send a 200 JSON response
+
+        gzipped says whether body is the gzipped variant of a response that
+        depends on Accept-Encoding; leave it None for one that doesn't.
+        """
+        encoding = b''
+        if gzipped is not None:
+            encoding = b'Vary: Accept-Encoding\r\n'
+            if gzipped:
+                encoding += b'Content-Encoding: gzip\r\n'
+        self.log_request(200)
+        # Status line, headers and body in a single write
+        self.wfile.write(self.JSON_RESPONSE_HEAD % (encoding, len(body)) + body)
+    
     def do_GET(self):
         parsed_path = urlparse(self.path)
         
@@ -94,68 +558,30 @@ class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
     def proxy_tracker_api(self, parsed_path):
         """Proxy requests to the tracker HTTPS API on port 9998"""
         try:
-            url = f"{TRACKER_API}{parsed_path.path}"
+            path = parsed_path.path
             if parsed_path.query:
-                url += f"?{parsed_path.query}"
-            # Skip SSL verification for self-signed cert (local loopback)
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=5, context=ctx) as resp:
-                body = resp.read()
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(body)
+                path += f"?{parsed_path.query}"
+            self.send_json(tracker_get(path))
         except Exception as e:
             self.send_response(502)
             self.send_header('Content-Type', 'application/json')
             self.end_headers()
-            self.wfile.write(json.dumps({
+            self.wfile.write(json_dumps({
                 'error': 'Tracker API unavailable',
                 'detail': str(e)
-            }).encode())
+            }))
     
     def handle_single_game(self, game_id):
         """Return a single game by ID"""
         try:
-            data = load_games_data()
+            load_games_data()
             
-            games = data.get('games', [])
-            
-            # Try to find game by ID
-            game = None
-            for g in games:
-                if g.get('id') == game_id:
-                    game = g
-                    break
-            
-            # If not found by ID, try matching by old filename-based ID
-            if not game and '-' in game_id:
-                import re
-                ts_match = re.search(r'(\d{2}-\d{2}-\d{4}-\d{2}-\d{2}-\d{2})', game_id)
-                if ts_match:
-                    for g in games:
-                        if g.get('timestamp'):
-                            game_ts = g['timestamp'].replace(':', '').replace('T', '-').replace('Z', '')
-                            if ts_match.group(1).replace('-', '') in game_ts.replace('-', ''):
-                                game = g
-                                break
-            
-            if not game:
+            body = get_single_game_response(game_id)
+            if body is None:
                 self.send_error(404, f"Game not found: {game_id}")
                 return
             
-            response = {
-                'game': game,
-                'players': data.get('players', [])
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self.send_json(body)
             
         except Exception as e:
             self.send_error(500, f"Error loading game: {str(e)}")
@@ -163,28 +589,10 @@ class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
     def handle_games_meta(self):
         """Return metadata: total games count, total players, etc."""
         try:
-            data = load_games_data()
-            
-            games = data.get('games', [])
-            players = data.get('players', [])
+            load_games_data()
             
-            # Calculate stats
-            duels = sum(1 for g in games if g.get('players') and len(g['players']) == 2)
-            ffa = sum(1 for g in games if g.get('players') and len(g['players']) > 2)
-            
-            meta = {
-                'totalGames': len(games),
-                'totalPlayers': len(players),
-                'duels': duels,
-                'ffa': ffa,
-                'oldestGame': games[-1]['timestamp'] if games else None,
-                'newestGame': games[0]['timestamp'] if games else None
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(meta).encode())
+            gzipped = self.accepts_gzip()
+            self.send_json(get_games_meta_response(gzipped), gzipped)
             
         except Exception as e:
             self.send_error(500, f"Error loading metadata: {str(e)}")
@@ -197,52 +605,13 @@ class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
             limit = int(query.get('limit', ['100'])[0])
             load_all = query.get('all', ['false'])[0].lower() == 'true'
             
-            data = load_games_data()
-            
-            games = data.get('games', [])
-            players = data.get('players', [])
+            load_games_data()
             
-            # If load_all is requested, return everything
-            if load_all:
-                response = {
-                    'games': games,
-                    'players': players,
-                    'pagination': {
-                        'page': 1,
-                        'limit': len(games),
-                        'total': len(games),
-                        'totalPages': 1,
-                        'hasMore': False
-                    }
-                }
-            else:
-                # Limit max page size
-                limit = min(limit, 500)
-                
-                # Calculate pagination
-                total = len(games)
-                start = (page - 1) * limit
-                end = start + limit
-                
-                page_games = games[start:end]
-                
-                response = {
-                    'games': page_games,
-                    'players': players,
-                    'pagination': {
-                        'page': page,
-                        'limit': limit,
-                        'total': total,
-                        'totalPages': (total + limit - 1) // limit,
-                        'hasMore': end < total
-                    }
-                }
+            # Limit max page size
+            limit = min(limit, 500)
             
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
-
+            gzipped = self.accepts_gzip()
+            self.send_json(get_games_response(page, limit, load_all, gzipped), gzipped)
             
         except Exception as e:
             self.send_error(500, f"Error loading games: {str(e)}")
@@ -252,7 +621,142 @@ class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
         if '/api/' in self.path:
             sys.stderr.write(f"[API] {format%args}\n")
 
+# Pids of the server processes (only the supervisor has any)
+_worker_pids = []
+
+# How long a new worker gets to start listening, and how long a stopping
+# one lets the requests it took on run before it exits anyway (seconds)
+WORKER_START_TIMEOUT = 10
+WORKER_DRAIN_TIMEOUT = 30
+
+def serve_worker(httpd, ready_fd):
+    """Serve the supervisor's listening socket in this process until SIGTERM, then drain
+
+    A byte is written to ready_fd once it's about to accept. On SIGTERM it
+    stops accepting, leaving new connections queued on the socket for the
+    other workers, and waits up to WORKER_DRAIN_TIMEOUT for the requests
+    in flight.
+    """
+    # shutdown() waits for serve_forever() to return, so it can't be called
+    # from a signal handler running on top of it
+    def stop(sig, frame):
+        threading.Thread(target=httpd.shutdown).start()
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    os.write(ready_fd, b'!')
+    os.close(ready_fd)
+    
+    httpd.serve_forever()
+    # server_close() waits for every handler thread (the socket it closes is
+    # only this process's copy)
+    closer = threading.Thread(target=httpd.server_close, daemon=True)
+    closer.start()
+    closer.join(WORKER_DRAIN_TIMEOUT)
+
+def fork_worker(httpd):
+    """Fork a process running serve_worker(), returning its pid once it's serving
+
+    Returns None if the worker died or hung before it started serving.
+    """
+    # Or the worker would flush whatever the supervisor had buffered
+    sys.stdout.flush()
+    sys.stderr.flush()
+    ready_fd, ready_w = os.pipe()
+    pid = os.fork()
+    if pid:
+        os.close(ready_w)
+        # A byte once it's serving, or EOF if it died first
+        readable, _, _ = select.select([ready_fd], [], [], WORKER_START_TIMEOUT)
+        started = bool(readable) and os.read(ready_fd, 1) == b'!'
+        os.close(ready_fd)
+        if started:
+            return pid
+        # reap_workers() collects it
+        print(f"Worker {pid} failed to start")
+        stop_workers([pid])
+        return None
+    
+    os.close(ready_fd)
+    _worker_pids.clear()
+    status = 0
+    try:
+        serve_worker(httpd, ready_w)
+    except SystemExit:
+        pass
+    except Exception:
+        traceback.print_exc()
+        status = 1
+    finally:
+        # Never unwind back into the supervisor's loop. The requests in
+        # flight have finished, or had WORKER_DRAIN_TIMEOUT to.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+def fork_workers(count, httpd):
+    """Fork count workers sharing the loaded caches copy-on-write, returning the started ones"""
+    # Keep the GC from touching (and so copying) the inherited caches
+    gc.freeze()
+    pids = [fork_worker(httpd) for _ in range(count)]
+    return [pid for pid in pids if pid is not None]
+
+def stop_workers(pids):
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+def reap_workers(httpd):
+    """Collect exited children, replacing any current worker that died"""
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        # Workers from before a reload (or that never started) are expected to go
+        if pid in _worker_pids:
+            print(f"Worker {pid} died ({os.waitstatus_to_exitcode(status)}), restarting it")
+            _worker_pids.remove(pid)
+            new_pid = fork_worker(httpd)
+            if new_pid is not None:
+                _worker_pids.append(new_pid)
+
+def supervise_workers(count, httpd):
+    """Keep count workers running until _watch_stop is set, re-forking them on reload
+
+    Only the supervisor loads games.json. When it changes, the supervisor
+    reloads and forks fresh workers to share the new caches, then stops
+    the old ones, so the caches are never rebuilt once per worker. It has
+    to wake up to reap workers anyway, and forking with watchfiles' thread
+    running isn't safe, so it polls the file rather than watching it.
+    Workers that fail to start aren't retried; if none are left running,
+    the supervisor gives up.
+    """
+    _worker_pids[:] = fork_workers(count, httpd)
+    while _worker_pids and not _watch_stop.wait(GAMES_POLL_INTERVAL):
+        reap_workers(httpd)
+        if reload_if_changed():
+            old_pids = _worker_pids[:]
+            # The new workers are serving before the old ones stop
+            # accepting; those drain and exit in their own time
+            _worker_pids[:] = fork_workers(count, httpd)
+            stop_workers(old_pids)
+    
+    if not _worker_pids:
+        sys.exit(f"No worker process could start serving on port {PORT}")
+
 def shutdown_handler(sig, frame):
+    # Take the workers down with us, once they've drained
+    stop_workers(_worker_pids)
+    for pid in _worker_pids:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+    stop_games_watcher()
     sys.exit(0)
 
 if __name__ == '__main__':
@@ -267,24 +771,30 @@ if __name__ == '__main__':
     except Exception as e:
         print(f"Warning: Failed to pre-load cache: {e}")
     
-    with ReusableTCPServer(("", PORT), CORSRequestHandler) as httpd:
-        # Wrap socket with SSL
-        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-        context.load_cert_chain(CERT_FILE, KEY_FILE)
-        httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
-        
-        import socket
-        hostname = socket.gethostname()
-        try:
-            local_ip = socket.gethostbyname(hostname)
-        except Exception:
-            local_ip = '0.0.0.0'
-        print(f" 🔒 HTTPS Server running at https://{local_ip}:{PORT}/")
-        print(f" Serving directory: {DIRECTORY}")
-        print(f" API endpoints: /api/games/meta, /api/games?page=1&limit=100")
-        print(f" Press Ctrl+C to stop")
-        print(f" Note: You'll need to accept the self-signed certificate in your browser")
-        try:
-            httpd.serve_forever()
-        except KeyboardInterrupt:
-            print("\n Server stopped")
+    # Bound once, here: configuration errors end the server before it forks,
+    # and every generation of workers inherits the socket, so connections
+    # queued on it survive the workers being replaced
+    httpd = ReusableTCPServer(("", PORT), CORSRequestHandler)
+    # Wrap socket with SSL
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(CERT_FILE, KEY_FILE)
+    httpd.socket = context.wrap_socket(httpd.socket, server_side=True,
+                                       do_handshake_on_connect=False)
+    # All the workers wait on it; the ones that lose the race for a
+    # connection mustn't then block in accept()
+    httpd.socket.setblocking(False)
+    
+    hostname = socket.gethostname()
+    try:
+        local_ip = socket.gethostbyname(hostname)
+    except Exception:
+        local_ip = '0.0.0.0'
+    print(f" 🔒 HTTPS Server running at https://{local_ip}:{PORT}/")
+    print(f" Serving directory: {DIRECTORY} ({WORKERS} worker processes)")
+    print(f" API endpoints: /api/games/meta, /api/games?page=1&limit=100")
+    print(f" Press Ctrl+C to stop")
+    print(f" Note: You'll need to accept the self-signed certificate in your browser")
+    try:
+        supervise_workers(WORKERS, httpd)
+    except KeyboardInterrupt:
+        print("\n Server stopped")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+asyncio (aiohttp) variant of serve.py for serving DXX Dashboard.
+
+Same endpoints and caches as serve.py, but every connection is a coroutine
+on one event loop rather than a thread, so thousands of idle or slow
+clients cost sockets instead of thread stacks, and tracker proxy requests
+overlap with everything else.
+
+Usage: python3 serve_async.py   (requires: pip install aiohttp)
+Runs on uvloop when it is installed (pip install uvloop).
+"""
+import asyncio
+import os
+import ssl
+import sys
+
+import aiohttp
+from aiohttp import web
+from aiohttp.abc import AbstractAccessLogger
+
+# uvloop runs the event loop and socket I/O in C on top of libuv
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+import serve
+from serve import PORT, TRACKER_API, DIRECTORY, CERT_FILE, KEY_FILE
+
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Cache-Control': 'no-cache',
+}
+
+def json_response(body, status=200):
+    return web.Response(body=body, status=status, content_type='application/json')
+
+def accepts_gzip(request):
+    return serve.accepts_gzip(request.headers.get('Accept-Encoding', ''))
+
+def cached_json_response(body, gzipped):
+    """Respond with a cached body, gzipped says whether it's the gzipped variant"""
+    headers = {'Vary': 'Accept-Encoding'}
+    if gzipped:
+        headers['Content-Encoding'] = 'gzip'
+    return web.Response(body=body, headers=headers, content_type='application/json')
+
+async def add_cors_headers(request, response):
+    response.headers.update(CORS_HEADERS)
+
+async def handle_options(request):
+    return web.Response()
+
+async def handle_index(request):
+    return web.FileResponse(os.path.join(DIRECTORY, 'index.html'))
+
+async def handle_games_api(request):
+    """Return paginated games data"""
+    try:
+        page = int(request.query.get('page', '1'))
+        limit = int(request.query.get('limit', '100'))
+        load_all = request.query.get('all', 'false').lower() == 'true'
+
+        serve.load_games_data()
+
+        # Limit max page size
+        limit = min(limit, 500)
+
+        gzipped = accepts_gzip(request)
+        return cached_json_response(serve.get_games_response(page, limit, load_all, gzipped),
+                                    gzipped)
+    except Exception as e:
+        raise web.HTTPInternalServerError(text=f"Error loading games: {str(e)}")
+
+async def handle_games_meta(request):
+    """Return metadata: total games count, total players, etc."""
+    try:
+        serve.load_games_data()
+        gzipped = accepts_gzip(request)
+        return cached_json_response(serve.get_games_meta_response(gzipped), gzipped)
+    except Exception as e:
+        raise web.HTTPInternalServerError(text=f"Error loading metadata: {str(e)}")
+
+async def handle_single_game(request):
+    """Return a single game by ID"""
+    game_id = request.match_info['game_id']
+    try:
+        serve.load_games_data()
+        body = serve.get_single_game_response(game_id)
+    except Exception as e:
+        raise web.HTTPInternalServerError(text=f"Error loading game: {str(e)}")
+    if body is None:
+        raise web.HTTPNotFound(text=f"Game not found: {game_id}")
+    return json_response(body)
+
+async def proxy_tracker_api(request):
+    """Proxy requests to the tracker HTTPS API on port 9998"""
+    try:
+        # Skip SSL verification for self-signed cert (local loopback)
+        async with request.app['tracker_session'].get(
+                f"{TRACKER_API}{request.path_qs}", ssl=False) as resp:
+            return json_response(await resp.read())
+    except Exception as e:
+        return json_response(serve.json_dumps({
+            'error': 'Tracker API unavailable',
+            'detail': str(e)
+        }), status=502)
+
+async def tracker_session(app):
+    """Keep one pooled client session to the tracker for the app's lifetime"""
+    timeout = aiohttp.ClientTimeout(total=5)
+    async with aiohttp.ClientSession(timeout=timeout, raise_for_status=True) as session:
+        app['tracker_session'] = session
+        yield
+
+class APIAccessLogger(AbstractAccessLogger):
+    def log(self, request, response, time):
+        # Only log API requests
+        if '/api/' in request.path:
+            sys.stderr.write(f'[API] "{request.method} {request.path_qs}" {response.status}\n')
+
+def make_app():
+    app = web.Application()
+    app.cleanup_ctx.append(tracker_session)
+    app.on_response_prepare.append(add_cors_headers)
+
+    app.router.add_get('/api/events/{path:.*}', proxy_tracker_api)
+    app.router.add_get('/api/firebase/{path:.*}', proxy_tracker_api)
+    app.router.add_get('/api/tracker/status', proxy_tracker_api)
+    app.router.add_get('/api/games', handle_games_api)
+    app.router.add_get('/api/games/meta', handle_games_meta)
+    app.router.add_get('/api/games/{game_id:.+}', handle_single_game)
+    app.router.add_route('OPTIONS', '/{path:.*}', handle_options)
+    # Regular file serving
+    app.router.add_get('/', handle_index)
+    app.router.add_static('/', DIRECTORY)
+    return app
+
+if __name__ == '__main__':
+    # Pre-load games data into cache on startup
+    print("Pre-loading games data into cache...")
+    try:
+        serve.load_games_data()
+        print("Cache initialized successfully")
+    except Exception as e:
+        print(f"Warning: Failed to pre-load cache: {e}")
+    # Reloads block for the whole rebuild, so keep them off the event loop
+    serve.start_games_watcher()
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(CERT_FILE, KEY_FILE)
+
+    print(f" 🔒 HTTPS Server (asyncio) running on port {PORT}")
+    print(f" Serving directory: {DIRECTORY}")
+    print(f" API endpoints: /api/games/meta, /api/games?page=1&limit=100")
+    print(f" Press Ctrl+C to stop")
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    print(f" Event loop: {'uvloop' if uvloop is not None else 'asyncio'}")
+
+    # run_app handles SIGINT/SIGTERM itself
+    web.run_app(make_app(), port=PORT, ssl_context=context, loop=loop,
+                access_log_class=APIAccessLogger, print=None)
+    serve.stop_games_watcher()
+    print("\n Server stopped")